@@ -0,0 +1,165 @@
+"""Shared helpers and constants for Google SEO Scout.
+
+Everything here is import-light so both the main script and the lazily
+loaded use-case handlers can pull from one place without cycles.
+"""
+
+import string
+from datetime import datetime
+from functools import lru_cache
+
+import streamlit as st
+
+# --- Helper Function to Open Google Search ---
+_GOOGLE_SEARCH_PREFIX = "https://www.google.com/search?q="
+
+# Characters legal in a URL query component that Google's operators use;
+# leaving them unescaped shortens the encode pass and the resulting URL.
+_QUERY_SAFE = ":()*$"
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _google_url(query):
+    # Deferred so module import (paid on every cold start) skips urllib.parse;
+    # the cost lands on the first cache miss instead.
+    from urllib.parse import quote_plus
+    return _GOOGLE_SEARCH_PREFIX + quote_plus(query, safe=_QUERY_SAFE)
+
+def open_google_search(query):
+    # Keep a short most-recent-first queue of generated queries so users can
+    # reopen several searches in one place instead of regenerating each.
+    recent = st.session_state.setdefault("recent_queries", [])
+    if query in recent:
+        recent.remove(query)
+    recent.insert(0, query)
+    del recent[10:]
+    # Mirror the latest query into the page URL so sessions are shareable
+    # and bookmarkable; Streamlit diffs query params cheaply.
+    st.query_params["q"] = query
+    st.link_button("Open in Google Search", _google_url(query))
+
+def _assemble(fields):
+    """Join the non-empty (value, template) pairs into one query string."""
+    return " ".join(template.format(value) for value, template in fields if value)
+
+# --- Cached Builders for the Common site:/keyword Queries ---
+@st.cache_data(max_entries=256)
+def _site_query(domain):
+    return f"site:{domain}"
+
+@st.cache_data(max_entries=256)
+def _site_keyword_query(domain, keyword):
+    return f"site:{domain} \"{keyword}\""
+
+@st.cache_data(max_entries=256)
+def _site_inurl_query(domain, keyword):
+    return f"site:{domain} inurl:\"{keyword}\""
+
+# --- Helper Functions to Parse Free-Text Lists ---
+@st.cache_data(max_entries=256)
+def _split_lines(text):
+    return tuple(stripped for item in text.split("\n") if (stripped := item.strip()))
+
+@st.cache_data(max_entries=256)
+def _split_csv(text):
+    return tuple(stripped for item in text.split(",") if (stripped := item.strip()))
+
+# --- Helper Function for Basic Domain Validation ---
+_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+_TLD_CHARS = frozenset(string.ascii_letters)
+
+@lru_cache(maxsize=256)
+def is_valid_domain(domain):
+    if not domain:
+        return False
+    # RFC 1035 caps a full domain at 253 chars; rejecting non-ASCII and
+    # oversized input up front keeps the label scan from ever seeing it.
+    if not domain.isascii() or len(domain) > 253:
+        return False
+    if "." not in domain:
+        return False
+    labels = domain.split(".")
+    tld = labels.pop()
+    if not labels or not (2 <= len(tld) <= 6 and _TLD_CHARS.issuperset(tld)):
+        return False
+    return all(
+        1 <= len(label) <= 63
+        and label[0] != "-"
+        and label[-1] != "-"
+        and _LABEL_CHARS.issuperset(label)
+        for label in labels
+    )
+
+# Lowercases ASCII and swaps spaces for hyphens in one pass, for author-URL slugs.
+_AUTHOR_TR = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "-")
+
+# --- Shared Warning Messages ---
+_WARN_VALID_DOMAIN = "Please enter a valid domain."
+_WARN_BOTH_FIELDS = "Please fill both fields."
+_WARN_ONE_FIELD = "Please fill at least one field."
+_WARN_DOMAIN_AND_KEYWORD = "Please enter domain and keyword."
+
+# Captured once at startup for the outdated-content year widget; server
+# processes don't live across year boundaries long enough to matter.
+_CURRENT_YEAR = datetime.now().year
+
+# --- Static Option Lists and Query Fragments ---
+_GUEST_PHRASES = ("\"write for us\"", "\"guest post\"", "\"contribute\"", "\"submit a post\"", "\"guest blogging guidelines\"")
+_FILE_TYPES_ALL = ("pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "csv", "xml", "txt", "zip", "sql", "env", "bak")
+_SOURCE_FILE_TYPES = ("pdf", "ppt", "pptx", "doc", "docx")
+_RESOURCE_OPERATORS = "(intitle:resources | inurl:resource | intitle:links | inurl:links | intitle:directory)"
+_INFOGRAPHIC_PHRASES = ("\"submit infographic\"", "\"infographic submission\"", "\"post infographic\"")
+_SPONSORED_PHRASES = ("\"sponsored post\"", "\"this post was sponsored by\"", "\"advertorial\"", "\"paid post\"")
+_SOCIAL_PLATFORMS = ("linkedin.com", "twitter.com", "facebook.com", "instagram.com", "youtube.com")
+_SOCIAL_PLATFORMS_DEFAULT = ("linkedin.com", "twitter.com")
+_FORUM_SITES = ("reddit.com", "quora.com")
+_MENTION_PLATFORMS = ("docs.google.com", "drive.google.com", "slideshare.net", "medium.com", "notion.so")
+_FILETYPE_TOKEN = {ft: f"filetype:{ft}" for ft in _FILE_TYPES_ALL}
+_SITE_TOKEN = {s: f"site:{s}" for s in (
+    "linkedin.com", "twitter.com", "facebook.com", "instagram.com", "youtube.com",
+    "reddit.com", "quora.com", "docs.google.com", "drive.google.com",
+    "slideshare.net", "medium.com", "notion.so",
+)}
+
+# Bound .format templates for the General Query Builder, one per input in
+# widget order; calling them skips per-rerun f-string assembly.
+_BUILDER_FMTS = tuple(template.format for template in (
+    "{}", "site:{}", "inurl:{}", "intitle:{}", "filetype:{}",
+    "\"{}\"", "-{}", "({})", "before:{}", "after:{}",
+))
+_OP_RELATED = "related:{}".format
+_OP_CACHE = "cache:{}".format
+_OP_SITE = "site:{}".format
+_OP_AFTER = "after:{}".format
+_OP_BEFORE = "before:{}".format
+_OP_BEFORE_YEAR = "before:{}-01-01".format
+# Formats one sponsored-post phrase into its dual intext:/intitle: clause.
+_SPONSORED_TMPL = "intext:{0} OR intitle:{0}".format
+
+# --- Use Case Labels ---
+# Selectbox options for the Specific Use Cases section; use_cases.HANDLERS
+# zips its handler functions against this tuple, so order matters.
+_USE_CASE_LABELS = (
+    "🕸️ Find Possible Indexing Issues",
+    "⚔️ Find and Analyze Your Competitors",
+    "✍️ Find Guest Post Opportunities",
+    "📚 Find Resource Page Opportunities",
+    "📄 Find Specific File Types on a Site",
+    "🔗 Find Opportunities to Add Internal Links",
+    "🏆 Find “Best” Listicles that Don’t Mention Your Brand",
+    "⭐ Find Websites that Have Reviewed Competitors",
+    "💬 Find Relevant Quora and Reddit Questions to Answer",
+    "⚡ Find How Fast Your Competitors are Publishing New Content",
+    "🔒 Find Non-Secure Pages",
+    "📝 Find Plagiarized Content",
+    "🧑‍💻 Find Prolific Guest Bloggers",
+    "📈 Find Competitor's Top Pages for a Keyword",
+    "🔢 Find Content in a Numeric Range",
+    "📄 Find Credible Sources for Articles",
+    "📊 Find Infographic Submission Opportunities",
+    "👤 Find Social Profiles for Outreach",
+    "🗣️ Join Social Conversations on Forums",
+    "🌐 Find Mentions on Specific Platforms",
+    "🗓️ Find Outdated Content",
+    "💰 Find Sponsored Post Opportunities",
+    "🔍 Find Competitor's Content by Topic",
+)
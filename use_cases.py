@@ -0,0 +1,411 @@
+"""Use-case handlers for the Specific Use Cases section.
+
+Imported lazily by streamlit_app on first selection so sessions that only
+touch the cheatsheet or the builder never pay for compiling the handlers.
+"""
+
+import streamlit as st
+
+from common import (
+    _AUTHOR_TR,
+    _assemble,
+    _CURRENT_YEAR,
+    _FILETYPE_TOKEN,
+    _FILE_TYPES_ALL,
+    _FORUM_SITES,
+    _GUEST_PHRASES,
+    _INFOGRAPHIC_PHRASES,
+    _MENTION_PLATFORMS,
+    _OP_BEFORE_YEAR,
+    _OP_SITE,
+    _RESOURCE_OPERATORS,
+    _SITE_TOKEN,
+    _SOCIAL_PLATFORMS,
+    _SOCIAL_PLATFORMS_DEFAULT,
+    _SOURCE_FILE_TYPES,
+    _SPONSORED_PHRASES,
+    _SPONSORED_TMPL,
+    _USE_CASE_LABELS,
+    _WARN_BOTH_FIELDS,
+    _WARN_DOMAIN_AND_KEYWORD,
+    _WARN_ONE_FIELD,
+    _WARN_VALID_DOMAIN,
+    _site_inurl_query,
+    _site_keyword_query,
+    _site_query,
+    _split_csv,
+    _split_lines,
+    is_valid_domain,
+    open_google_search,
+)
+
+# --- Use Case Handlers ---
+@st.fragment
+def _uc_indexing():
+    st.subheader("Find Possible Indexing Issues")
+    domain = st.text_input("Your Website Domain (e.g., yoursite.com)", key="indexing_domain")
+    if st.button("Generate Query", key="indexing_btn"):
+        if is_valid_domain(domain):
+            query = _site_query(domain)
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_VALID_DOMAIN)
+
+@st.fragment
+def _uc_competitors():
+    st.subheader("Find and Analyze Your Competitors")
+    competitor_domain = st.text_input("Competitor Domain (e.g., competitor.com)", key="comp_domain")
+    keyword = st.text_input("Keyword (optional)", key="comp_keyword")
+    if st.button("Generate Query", key="comp_btn"):
+        query = _assemble((
+            (competitor_domain if is_valid_domain(competitor_domain) else "", "related:{}"),
+            (keyword, "{}"),
+        ))
+        if query:
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter domain or keyword.")
+
+@st.fragment
+def _uc_guest_posts():
+    st.subheader("Find Guest Post Opportunities")
+    niche = st.text_input("Your Niche (e.g., SEO)", key="guest_niche")
+    phrases = st.multiselect("Guest Post Phrases", _GUEST_PHRASES,
+        default=[_GUEST_PHRASES[0]], key="guest_phrases")
+    if st.button("Generate Query", key="guest_btn"):
+        if niche and phrases:
+            phrase_query = " | ".join(phrases)
+            query = f"{niche} ({phrase_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter niche and select phrases.")
+
+@st.fragment
+def _uc_resource_pages():
+    st.subheader("Find Resource Page Opportunities")
+    topic = st.text_input("Topic/Keyword (e.g., SEO tools)", key="resource_topic")
+    if st.button("Generate Query", key="resource_btn"):
+        if topic:
+            query = f"{topic} {_RESOURCE_OPERATORS}"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter a topic.")
+
+@st.fragment
+def _uc_file_types():
+    st.subheader("Find Specific File Types on a Site")
+    file_site = st.text_input("Site Domain (optional, e.g., yoursite.com)", key="file_site")
+    file_keywords = st.text_input("Keywords (optional)", key="file_keywords")
+    file_types = st.multiselect(
+        "File Types", _FILE_TYPES_ALL,
+        default=["pdf"], key="file_types")
+    if st.button("Generate Query", key="file_btn"):
+        parts = []
+        if is_valid_domain(file_site):
+            parts.append(_OP_SITE(file_site))
+        if file_keywords:
+            parts.append(file_keywords)
+        if file_types:
+            parts.append("(" + " | ".join(map(_FILETYPE_TOKEN.__getitem__, file_types)) + ")")
+        query = " ".join(parts)
+        if query:
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_ONE_FIELD)
+
+@st.fragment
+def _uc_internal_links():
+    st.subheader("Find Opportunities to Add Internal Links")
+    site = st.text_input("Your Site/Blog Domain", key="internal_link_site")
+    keyword = st.text_input("Target Keyword", key="internal_link_keyword")
+    if st.button("Generate Query", key="internal_link_btn"):
+        if is_valid_domain(site) and keyword:
+            query = _site_keyword_query(site, keyword)
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_DOMAIN_AND_KEYWORD)
+
+@st.fragment
+def _uc_listicles():
+    st.subheader("Find “Best” Listicles that Don’t Mention Your Brand")
+    brand = st.text_input("Your Brand Name", key="listicle_brand")
+    topic = st.text_input("Listicle Topic", key="listicle_topic")
+    if st.button("Generate Query", key="listicle_btn"):
+        if brand and topic:
+            query = f"intitle:best \"{topic}\" -\"{brand}\""
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter brand and topic.")
+
+@st.fragment
+def _uc_competitor_reviews():
+    st.subheader("Find Websites that Have Reviewed Competitors")
+    competitors = st.text_area("Competitor Brands (one per line)", key="review_competitors")
+    if st.button("Generate Query", key="review_btn"):
+        brands = _split_lines(competitors)
+        if brands:
+            brands_query = " OR ".join(f'"{b}"' for b in brands)
+            query = f"allintitle:review ({brands_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter at least one competitor.")
+
+@st.fragment
+def _uc_qa_questions():
+    st.subheader("Find Relevant Quora and Reddit Questions to Answer")
+    topics = st.text_input("Topics (comma separated)", key="qa_topics")
+    if st.button("Generate Query", key="qa_btn"):
+        topic_query = " | ".join(_split_csv(topics))
+        if topic_query:
+            query = f"(site:quora.com OR site:reddit.com) inurl:({topic_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter topics.")
+
+@st.fragment
+def _uc_comp_speed():
+    st.subheader("Find How Fast Your Competitors are Publishing New Content")
+    domain = st.text_input("Competitor Domain", key="comp_speed_domain")
+    date_range = st.date_input("Published Date Range", value=(), key="comp_speed_range")
+    after, before = (tuple(date_range) + (None, None))[:2]
+    if st.button("Generate Query", key="comp_speed_btn"):
+        query = _assemble((
+            (domain if is_valid_domain(domain) else "", "site:{}"),
+            (after and after.isoformat(), "after:{}"),
+            (before and before.isoformat(), "before:{}"),
+        ))
+        if query:
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_ONE_FIELD)
+
+@st.fragment
+def _uc_non_secure():
+    st.subheader("Find Non-Secure Pages")
+    domain = st.text_input("Your Website Domain", key="non_secure_domain")
+    if st.button("Generate Query", key="non_secure_btn"):
+        if is_valid_domain(domain):
+            query = f"site:{domain} -inurl:https"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter domain.")
+
+@st.fragment
+def _uc_plagiarism():
+    st.subheader("Find Plagiarized Content")
+    text = st.text_area("Exact Text Snippet", key="plagiarism_text")
+    if st.button("Generate Query", key="plagiarism_btn"):
+        if text:
+            query = f"allintext:\"{text}\""
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter a text snippet.")
+
+@st.fragment
+def _uc_bloggers():
+    st.subheader("Find Prolific Guest Bloggers")
+    niche = st.text_input("Niche/Keywords", key="blogger_niche")
+    author = st.text_input("Specific Author Name (optional)", key="blogger_author")
+    if st.button("Generate Query", key="blogger_btn"):
+        parts = []
+        if niche:
+            parts.append(niche)
+        if author:
+            parts.append(f"inurl:author/{author.translate(_AUTHOR_TR)}")
+        else:
+            parts.append("inurl:author/")
+        query = " ".join(parts)
+        if query:
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter a niche or author.")
+
+@st.fragment
+def _uc_top_pages():
+    st.subheader("Find Competitor's Top Pages for a Keyword")
+    domain = st.text_input("Competitor Domain", key="top_pages_domain")
+    keyword = st.text_input("Keyword/Topic", key="top_pages_keyword")
+    if st.button("Generate Query", key="top_pages_btn"):
+        if is_valid_domain(domain) and keyword:
+            query = _site_inurl_query(domain, keyword)
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_DOMAIN_AND_KEYWORD)
+
+@st.fragment
+def _uc_numeric_range():
+    st.subheader("Find Content in a Numeric Range")
+    keywords = st.text_input("Keywords", key="numeric_keywords")
+    min_value = st.number_input("Min Value", min_value=0, value=10, key="min_value")
+    max_value = st.number_input("Max Value", min_value=0, value=100, key="max_value")
+    currency_symbol = st.text_input("Currency Symbol (optional)", max_chars=1, key="currency_symbol")
+    if st.button("Generate Query", key="numeric_btn"):
+        if min_value < max_value:
+            range_query = f"{currency_symbol}{min_value}..{currency_symbol}{max_value}"
+            query = " ".join(filter(None, (keywords, range_query)))
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Min value must be less than max value.")
+
+@st.fragment
+def _uc_credible_sources():
+    st.subheader("Find Credible Sources for Articles")
+    keywords = st.text_input("Keywords for Research", key="source_keywords")
+    file_types = st.multiselect("File Types", _SOURCE_FILE_TYPES, default=["pdf"], key="source_file_types")
+    if st.button("Generate Query", key="source_btn"):
+        if keywords and file_types:
+            filetype_query = " | ".join(map(_FILETYPE_TOKEN.__getitem__, file_types))
+            query = f"{keywords} ({filetype_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_BOTH_FIELDS)
+
+@st.fragment
+def _uc_infographics():
+    st.subheader("Find Infographic Submission Opportunities")
+    niche = st.text_input("Niche/Keywords", key="infographic_niche")
+    phrases = st.multiselect("Submission Phrases", _INFOGRAPHIC_PHRASES, default=[_INFOGRAPHIC_PHRASES[0]], key="infographic_phrases")
+    if st.button("Generate Query", key="infographic_btn"):
+        if niche and phrases:
+            phrase_query = " | ".join(
+                "intitle:{0} OR inurl:{1}".format(p, p.replace('"', '').replace(' ', '-'))
+                for p in phrases
+            )
+            query = f"{niche} ({phrase_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_BOTH_FIELDS)
+
+@st.fragment
+def _uc_social_profiles():
+    st.subheader("Find Social Profiles for Outreach")
+    name = st.text_input("Brand or Person Name", key="social_name")
+    platforms = st.multiselect("Platforms", _SOCIAL_PLATFORMS, default=_SOCIAL_PLATFORMS_DEFAULT, key="social_platforms")
+    if st.button("Generate Query", key="social_btn"):
+        if name and platforms:
+            site_query = " OR ".join(_SITE_TOKEN[p] for p in platforms)
+            query = f"\"{name}\" ({site_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_BOTH_FIELDS)
+
+@st.fragment
+def _uc_forum_conversations():
+    st.subheader("Join Social Conversations on Forums")
+    topic = st.text_input("Topic Keywords", key="conversation_topic")
+    forum_sites = st.multiselect("Forum Sites", _FORUM_SITES, default=_FORUM_SITES, key="forum_sites")
+    custom_forum = st.text_input("Custom Forum Domain (optional)", key="custom_forum")
+    if st.button("Generate Query", key="conversation_btn"):
+        candidates = [*forum_sites, custom_forum] if custom_forum else forum_sites
+        all_sites = list(dict.fromkeys(filter(is_valid_domain, candidates)))
+        if not (topic and all_sites):
+            st.warning("Please enter a topic and at least one forum.")
+            return
+        site_query = " OR ".join(_SITE_TOKEN.get(s) or f"site:{s}" for s in all_sites)
+        query = f"({site_query}) \"{topic}\" (intext:question | intext:discussion | intitle:forum)"
+        st.code(query)
+        open_google_search(query)
+
+@st.fragment
+def _uc_platform_mentions():
+    st.subheader("Find Mentions on Specific Platforms")
+    keywords = st.text_input("Brand/Topic Keywords", key="mention_keywords")
+    platforms = st.multiselect("Platforms", _MENTION_PLATFORMS, default=[_MENTION_PLATFORMS[0]], key="mention_platforms")
+    custom_platform = st.text_input("Custom Platform Domain (optional)", key="custom_platform")
+    if st.button("Generate Query", key="mention_btn"):
+        candidates = [*platforms, custom_platform] if custom_platform else platforms
+        all_sites = list(dict.fromkeys(filter(is_valid_domain, candidates)))
+        if not (keywords and all_sites):
+            st.warning(_WARN_BOTH_FIELDS)
+            return
+        site_query = " OR ".join(_SITE_TOKEN.get(s) or f"site:{s}" for s in all_sites)
+        query = f"\"{keywords}\" ({site_query})"
+        st.code(query)
+        open_google_search(query)
+
+@st.fragment
+def _uc_outdated():
+    st.subheader("Find Outdated Content")
+    domain = st.text_input("Website Domain", key="outdated_domain")
+    year_before = st.number_input("Published Before Year", min_value=1990, max_value=_CURRENT_YEAR, value=_CURRENT_YEAR-2, key="outdated_year")
+    keywords = st.text_input("Keywords (optional)", key="outdated_keywords")
+    if st.button("Generate Query", key="outdated_btn"):
+        if is_valid_domain(domain):
+            base = _site_keyword_query(domain, keywords) if keywords else _site_query(domain)
+            query = f"{base} {_OP_BEFORE_YEAR(year_before)}"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_VALID_DOMAIN)
+
+@st.fragment
+def _uc_sponsored():
+    st.subheader("Find Sponsored Post Opportunities")
+    niche = st.text_input("Niche/Keywords", key="sponsored_niche")
+    phrases = st.multiselect("Sponsored Post Phrases", _SPONSORED_PHRASES, default=[_SPONSORED_PHRASES[0]], key="sponsored_phrases")
+    if st.button("Generate Query", key="sponsored_btn"):
+        if niche and phrases:
+            phrase_query = " | ".join(map(_SPONSORED_TMPL, phrases))
+            query = f"{niche} ({phrase_query})"
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning(_WARN_BOTH_FIELDS)
+
+@st.fragment
+def _uc_comp_topic():
+    st.subheader("Find Competitor's Content by Topic")
+    domain = st.text_input("Competitor Domain", key="comp_topic_domain")
+    keywords = st.text_input("Topic Keywords", key="comp_topic_keywords")
+    if st.button("Generate Query", key="comp_topic_btn"):
+        if is_valid_domain(domain) and keywords:
+            query = _site_keyword_query(domain, keywords)
+            st.code(query)
+            open_google_search(query)
+        else:
+            st.warning("Please enter domain and keywords.")
+
+# Label -> handler, aligned with the selectbox options in common.py.
+HANDLERS = dict(zip(_USE_CASE_LABELS, (
+    _uc_indexing,
+    _uc_competitors,
+    _uc_guest_posts,
+    _uc_resource_pages,
+    _uc_file_types,
+    _uc_internal_links,
+    _uc_listicles,
+    _uc_competitor_reviews,
+    _uc_qa_questions,
+    _uc_comp_speed,
+    _uc_non_secure,
+    _uc_plagiarism,
+    _uc_bloggers,
+    _uc_top_pages,
+    _uc_numeric_range,
+    _uc_credible_sources,
+    _uc_infographics,
+    _uc_social_profiles,
+    _uc_forum_conversations,
+    _uc_platform_mentions,
+    _uc_outdated,
+    _uc_sponsored,
+    _uc_comp_topic,
+)))